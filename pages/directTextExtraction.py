@@ -26,6 +26,7 @@ import pymupdf4llm
 import pdfplumber
 import fitz
 import pandas as pd
+import numpy as np
 import camelot
 
 def convert_bytes_to_string(obj):
@@ -76,6 +77,100 @@ def export_tables_to_csv(dataframes):
             csv_data.write("\n")
     return csv_data.getvalue()
 
+PAGE_PROFILE_DTYPE = np.dtype([
+    ("text_count", np.int32),
+    ("image_count", np.int32),
+    ("image_coverage", np.float32),
+    ("vector_count", np.int32),
+    ("rotation", np.int16),
+    ("table_likelihood", np.float32),
+])
+MIN_TEXT_ITEMS = 1
+IMAGE_ONLY_COVERAGE = 0.5
+
+def profile_pages(doc):
+    """Build a per-page feature index of an open fitz.Document as a structured array.
+
+    Uses a single get_bboxlog() pass per page: text_count is the number of text runs
+    (including invisible OCR text), vector_count the number of drawn paths.
+    rotation is recorded for reference only and does not affect routing.
+    """
+    profile = np.zeros(doc.page_count, dtype=PAGE_PROFILE_DTYPE)
+    for page_num in range(doc.page_count):
+        page = doc[page_num]
+        page_rect = page.rect
+        page_area = abs(page_rect) or 1.0
+
+        text_count = image_count = vector_count = 0
+        covered_area = 0.0
+        for kind, bbox in page.get_bboxlog():
+            if kind.endswith("-text"):
+                text_count += 1
+            elif kind.endswith("-path"):
+                vector_count += 1
+            elif kind in ("fill-image", "fill-imgmask"):
+                image_count += 1
+                covered_area += abs(fitz.Rect(bbox) & page_rect)
+        image_coverage = min(1.0, covered_area / page_area)
+
+        if text_count < MIN_TEXT_ITEMS:
+            table_likelihood = 0.0
+        else:
+            scan_likelihood = image_coverage if image_coverage >= IMAGE_ONLY_COVERAGE else 0.0
+            table_likelihood = max(min(1.0, vector_count / 20.0), scan_likelihood)
+
+        profile[page_num] = (
+            text_count,
+            image_count,
+            image_coverage,
+            vector_count,
+            page.rotation,
+            table_likelihood,
+        )
+    return profile
+
+def get_page_profile(file_path):
+    """Return the cached page profile for file_path, profiling the document on first use."""
+    cached = st.session_state.get("page_profile")
+    if cached is not None and cached[0] == file_path:
+        return cached[1]
+    with st.spinner("Profiling pages..."):
+        with fitz.open(file_path) as doc:
+            profile = profile_pages(doc)
+    st.session_state.page_profile = (file_path, profile)
+    return profile
+
+def text_pages(profile):
+    """Return a boolean mask of pages with a text layer."""
+    return profile["text_count"] >= MIN_TEXT_ITEMS
+
+def image_only_pages(profile):
+    """Return a boolean mask of scanned pages: no text layer, mostly covered by images."""
+    return ~text_pages(profile) & (profile["image_coverage"] >= IMAGE_ONLY_COVERAGE)
+
+def table_candidate_pages(profile, strategy="lines"):
+    """Return a boolean mask of pages worth handing to a table extractor.
+
+    "lines" (PyMuPDF/pdfplumber defaults) needs vector paths, "lattice" also accepts
+    scanned pages with an OCR layer since Camelot finds ruling lines in the raster,
+    "stream" only needs text.
+    """
+    if strategy == "lines":
+        return text_pages(profile) & (profile["vector_count"] > 0)
+    if strategy == "lattice":
+        return profile["table_likelihood"] > 0
+    return text_pages(profile)
+
+def camelot_pages(profile, requested_pages, flavor):
+    """Return the 1-based requested pages Camelot should process for a flavor."""
+    candidates = table_candidate_pages(profile, strategy=flavor)
+    return [p for p in requested_pages if candidates[p - 1]]
+
+def show_skipped_pages(count, reason):
+    """Tell the user how many pages a mode skipped and why."""
+    if count:
+        st.caption(f"{count} page(s) skipped as {reason}")
+
 
 def show():
     st.title("Direct Text Extraction")
@@ -94,7 +189,9 @@ def show():
             )
         with col2:
             fname = os.path.basename(file_path)
-
+            page_profile = get_page_profile(file_path)
+            image_only = image_only_pages(page_profile)
+            has_text = text_pages(page_profile)
 
             st.markdown(
                 """
@@ -149,12 +246,13 @@ def show():
 
                 if pymupdf_option == "All Text":
                     all_text = ""
-                    for page_num in range(doc.page_count):
+                    show_skipped_pages(int((~has_text).sum()), "having no text layer")
+                    for page_num in np.flatnonzero(has_text).tolist():
                         page = doc[page_num]
                         all_text += (
                             f"\n--- Page {page_num + 1} ---\n{page.get_text()}\n"
                         )
-                    st.text_area("Full Document Text:", all_text, height=400)
+                    st.text_area("Full Document Text:", all_text or "No text found", height=400)
                     st.download_button("Export .txt", all_text, file_name=f"{os.path.splitext(fname)[0]}_all_text.txt")
 
                 elif pymupdf_option == "Specific Page":
@@ -177,9 +275,10 @@ def show():
 
                 elif pymupdf_option == "Markdown/JSON Output":
                     output_format = st.selectbox("Output Format:", ["Markdown", "JSON"])
+                    show_skipped_pages(int((~has_text).sum()), "having no text layer")
                     if output_format == "Markdown":
                         combined_md = []
-                        for page_num in range(doc.page_count):
+                        for page_num in np.flatnonzero(has_text).tolist():
                             md_text = pymupdf4llm.to_markdown(
                                 file_path, pages=[page_num]
                             )
@@ -194,7 +293,7 @@ def show():
                         )
                     elif output_format == "JSON":
                         export_obj = {}
-                        for page_num in range(doc.page_count):
+                        for page_num in np.flatnonzero(has_text).tolist():
                             page = doc[page_num]
                             json_text = page.get_text("dict")
                             json_text_clean = convert_bytes_to_string(json_text)
@@ -211,7 +310,8 @@ def show():
                     search_term = st.text_input("Enter text to search:")
                     if search_term:
                         results = []
-                        for page_num in range(doc.page_count):
+                        show_skipped_pages(int((~has_text).sum()), "having no text layer")
+                        for page_num in np.flatnonzero(has_text).tolist():
                             page = doc[page_num]
                             text_instances = page.search_for(search_term)
                             if text_instances:
@@ -241,7 +341,13 @@ def show():
                 elif pymupdf_option == "Table Detection":
                     found_any_table = False
                     csv_buffers = []
+                    table_pages = table_candidate_pages(page_profile)
+                    show_skipped_pages(int(image_only.sum()), "image-only")
+                    show_skipped_pages(int((~has_text & ~image_only).sum()), "having no text layer")
+                    show_skipped_pages(int((has_text & (page_profile["vector_count"] == 0)).sum()), "having no ruling lines")
                     for page_num in range(doc.page_count):
+                        if not table_pages[page_num]:
+                            continue
                         page = doc[page_num]
                         table_finder = page.find_tables()
                         tables = table_finder.tables if table_finder else []
@@ -272,7 +378,7 @@ def show():
                         )
 
                 elif pymupdf_option == "Image Extraction":
-                    for page_num in range(doc.page_count):
+                    for page_num in np.flatnonzero(page_profile["image_count"]).tolist():
                         page = doc[page_num]
                         image_list = page.get_images()
                         if image_list:
@@ -317,7 +423,10 @@ def show():
 
                     if plumber_option == "All Text":
                         all_text = ""
+                        show_skipped_pages(int((~has_text).sum()), "having no text layer")
                         for page_num, page in enumerate(pdf.pages):
+                            if not has_text[page_num]:
+                                continue
                             page_text = page.extract_text()
                             if page_text:
                                 all_text += (
@@ -356,7 +465,13 @@ def show():
                     elif plumber_option == "Table Extraction":
                         found_tables = False
                         csv_buffers = []
+                        table_pages = table_candidate_pages(page_profile)
+                        show_skipped_pages(int(image_only.sum()), "image-only")
+                        show_skipped_pages(int((~has_text & ~image_only).sum()), "having no text layer")
+                        show_skipped_pages(int((has_text & (page_profile["vector_count"] == 0)).sum()), "having no ruling lines")
                         for page_num, page in enumerate(pdf.pages):
+                            if not table_pages[page_num]:
+                                continue
                             tables = page.extract_tables()
                             if tables:
                                 found_tables = True
@@ -387,6 +502,8 @@ def show():
                     elif plumber_option == "Image Extraction":
                         found_images = False
                         for page_num, page in enumerate(pdf.pages):
+                            if not page_profile["image_count"][page_num]:
+                                continue
                             if hasattr(page, "images") and page.images:
                                 found_images = True
                                 st.success(
@@ -466,20 +583,31 @@ def show():
                             st.info("Line Scale only available for lattice algorithm")
                 show_debug = st.checkbox("Show Visual Debugging", help="Display detected table boundaries")
                 try:
+                    page_count = len(page_profile)
                     if pages_input.lower() == "all":
-                        pages_param = "all"
+                        requested_pages = list(range(1, page_count + 1))
                     else:
                         try:
-                            pages_param = [int(p.strip()) for p in pages_input.split(",")]
+                            requested_pages = [int(p.strip()) for p in pages_input.split(",")]
                         except ValueError:
                             st.error("Invalid page format. Use comma-separated numbers or 'all'")
-                            pages_param = "all"
+                            requested_pages = list(range(1, page_count + 1))
+                    invalid_pages = [p for p in requested_pages if not 1 <= p <= page_count]
+                    if invalid_pages:
+                        st.error(
+                            f"Invalid page number(s): {', '.join(str(p) for p in invalid_pages)}. "
+                            f"The document has {page_count} page(s)."
+                        )
+                        requested_pages = [p for p in requested_pages if 1 <= p <= page_count]
                     gs_available = _is_ghostscript_available()
                     effective_mode = camelot_mode.lower()
                     if effective_mode == "lattice" and not gs_available:
                         st.warning("Ghostscript not found. 'lattice' mode requires Ghostscript; automatically switching to 'stream' mode.")
                         effective_mode = "stream"
 
+                    routed_pages = camelot_pages(page_profile, requested_pages, effective_mode)
+                    pages_param = ",".join(str(p) for p in routed_pages)
+
                     camelot_params = {
                         "filepath": file_path,
                         "flavor": effective_mode,
@@ -489,33 +617,46 @@ def show():
                         camelot_params["line_scale"] = line_scale
                     if password:
                         camelot_params["password"] = password
-                    with st.spinner("Extracting tables with Camelot..."):
-                        with warnings.catch_warnings():
-                            warnings.simplefilter("ignore", UserWarning)
-                            try:
-                                tables = camelot.read_pdf(**camelot_params)
-                            except ZeroDivisionError as zde:
-                                st.error(f"Camelot encountered a division by zero error: {str(zde)}")
-                                st.warning("⚠️ This PDF cannot be processed by Camelot.")
-                                st.info("💡 **Please try these alternatives:**")
-                                st.info("1. **PDFplumber** - Switch to the 'PDFplumber' tab (recommended)")
-                                st.info("2. **PyMuPDF** - Use 'Table Detection' in the PyMuPDF tab")
-                                raise
-                            except Exception as camelot_exc:
-                                err_text = str(camelot_exc).lower()
-                                if ("ghostscript" in err_text or "image conversion failed" in err_text) and effective_mode == "lattice":
-                                    st.info("An error occurred in 'lattice' mode (Ghostscript missing/not working). Falling back to 'stream' mode…")
-                                    fallback_params = dict(camelot_params)
-                                    fallback_params["flavor"] = "stream"
-                                    try:
-                                        tables = camelot.read_pdf(**fallback_params)
-                                        effective_mode = "stream"
-                                    except ZeroDivisionError:
-                                        st.error("Stream mode also failed with division by zero error.")
-                                        st.info("💡 This PDF is not compatible with Camelot. Please use PDFplumber or PyMuPDF instead.")
-                                        raise
-                                else:
+                    if not routed_pages:
+                        tables = []
+                    else:
+                        with st.spinner("Extracting tables with Camelot..."):
+                            with warnings.catch_warnings():
+                                warnings.simplefilter("ignore", UserWarning)
+                                try:
+                                    tables = camelot.read_pdf(**camelot_params)
+                                except ZeroDivisionError as zde:
+                                    st.error(f"Camelot encountered a division by zero error: {str(zde)}")
+                                    st.warning("⚠️ This PDF cannot be processed by Camelot.")
+                                    st.info("💡 **Please try these alternatives:**")
+                                    st.info("1. **PDFplumber** - Switch to the 'PDFplumber' tab (recommended)")
+                                    st.info("2. **PyMuPDF** - Use 'Table Detection' in the PyMuPDF tab")
                                     raise
+                                except Exception as camelot_exc:
+                                    err_text = str(camelot_exc).lower()
+                                    if ("ghostscript" in err_text or "image conversion failed" in err_text) and effective_mode == "lattice":
+                                        st.info("An error occurred in 'lattice' mode (Ghostscript missing/not working). Falling back to 'stream' mode…")
+                                        fallback_params = dict(camelot_params)
+                                        fallback_params["flavor"] = "stream"
+                                        routed_pages = camelot_pages(page_profile, requested_pages, "stream")
+                                        fallback_params["pages"] = ",".join(str(p) for p in routed_pages)
+                                        try:
+                                            tables = camelot.read_pdf(**fallback_params)
+                                            effective_mode = "stream"
+                                        except ZeroDivisionError:
+                                            st.error("Stream mode also failed with division by zero error.")
+                                            st.info("💡 This PDF is not compatible with Camelot. Please use PDFplumber or PyMuPDF instead.")
+                                            raise
+                                    else:
+                                        raise
+
+                    routed = set(routed_pages)
+                    skipped_pages = [p for p in requested_pages if p not in routed]
+                    show_skipped_pages(sum(1 for p in skipped_pages if image_only[p - 1]), "image-only")
+                    show_skipped_pages(
+                        sum(1 for p in skipped_pages if not image_only[p - 1]),
+                        "having no ruling lines" if effective_mode == "lattice" else "having no text layer",
+                    )
 
                     if len(tables) > 0:
                         st.success(f"Found {len(tables)} table(s) using {effective_mode} algorithm")
@@ -587,7 +728,7 @@ def show():
                             )
                         
                     
-                    else:
+                    elif requested_pages:
                         st.warning("No tables found in the document")
                         st.info("Try switching between 'lattice' and 'stream' algorithms or adjusting the line scale")
 
@@ -0,0 +1,52 @@
+import pytest
+
+from tests.helpers import CORPUS, Baselines
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="Also run the 2,000-page text corpus.")
+    parser.addoption(
+        "--record-baselines",
+        action="store_true",
+        help="Measure instead of checking budgets and rewrite tests/baselines.json.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: needs --run-slow, takes many minutes")
+    config.addinivalue_line("markers", "camelot_fails(*flavors): recorded_camelot_calls raises for these flavors")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory):
+    """Lazily generate synthetic PDFs by name, once per test session."""
+    corpus_dir = tmp_path_factory.mktemp("corpus")
+    generated = {}
+
+    def get(name):
+        if name not in generated:
+            make, page_count = CORPUS[name]
+            path = str(corpus_dir / f"{name}.pdf")
+            make(path, page_count)
+            generated[name] = path
+        return generated[name]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    """Budgets from tests/baselines.json, rewritten at session end with --record-baselines."""
+    recorder = Baselines(record=request.config.getoption("--record-baselines"))
+    yield recorder
+    if recorder.record:
+        recorder.save()
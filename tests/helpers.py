@@ -0,0 +1,264 @@
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import types
+import warnings
+
+import fitz
+import pytest
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from pages import directTextExtraction
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES_PATH = os.path.join(REPO_ROOT, "tests", "baselines.json")
+
+# Multiplies every budget, to loosen them on slower machines.
+BUDGET_SCALE = float(os.environ.get("PDF2TEXT_BUDGET_SCALE", "1"))
+# A latency budget is the recorded baseline * LATENCY_MARGIN + LATENCY_SLACK; the
+# slack in seconds absorbs scheduler noise on interactions of a few milliseconds.
+LATENCY_MARGIN = 2.0
+LATENCY_SLACK = 0.05
+# A peak RSS budget is the recorded baseline * RSS_MARGIN.
+RSS_MARGIN = 1.25
+# Allowed growth in MB of the RSS retained after garbage collection, from the
+# RSS_WARMUP_RERUNS warm-up reruns to the RSS_RERUNS reruns that follow.
+RSS_GROWTH_BUDGET_MB = 50
+RSS_WARMUP_RERUNS = 4
+RSS_RERUNS = 5
+# Every measurement is the median of this many rounds, recorded or checked.
+MEASURE_ROUNDS = 3
+# Budgets apply on every host. When the current host differs from the recorded one
+# in any of these keys, a warning suggests re-recording or PDF2TEXT_BUDGET_SCALE.
+HOST_KEYS = ("system", "machine", "pymupdf", "streamlit")
+
+LOREM = (
+    "Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua "
+)
+
+
+def reference_host():
+    """Describe the machine and library versions baselines are recorded on."""
+    return {
+        "system": platform.system(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "pymupdf": fitz.VersionBind,
+        "streamlit": streamlit.__version__,
+        "ghostscript": directTextExtraction._is_ghostscript_available(),
+        "recorded": datetime.date.today().isoformat(),
+    }
+
+
+class Baselines:
+    """Check measurements against tests/baselines.json, or record them into it.
+
+    Each measurement runs MEASURE_ROUNDS times and its median is used. In record mode
+    (pytest --record-baselines) the median replaces the stored baseline; entries of
+    tests that did not run are kept. save() writes the file along with the reference
+    host. Otherwise budgets are checked, with a warning when the current host differs
+    from the recorded one in any of HOST_KEYS.
+    """
+
+    def __init__(self, record=False):
+        self.record = record
+        self.data = {"host": {}, "latency_s": {}, "peak_rss_mb": {}}
+        if os.path.exists(BASELINES_PATH):
+            with open(BASELINES_PATH) as f:
+                self.data.update(json.load(f))
+        if not record:
+            self._warn_on_other_host()
+
+    def _warn_on_other_host(self):
+        current = reference_host()
+        recorded = self.data["host"]
+        mismatch = [f"{key} {recorded.get(key)!r} != {current[key]!r}" for key in HOST_KEYS if recorded.get(key) != current[key]]
+        if mismatch:
+            warnings.warn(
+                f"baselines were recorded on another host ({', '.join(mismatch)}); "
+                "set PDF2TEXT_BUDGET_SCALE or run pytest --record-baselines if budgets do not fit"
+            )
+
+    def _baseline(self, section, *keys):
+        value = self.data[section]
+        try:
+            for key in keys:
+                value = value[key]
+        except KeyError:
+            pytest.fail(f"no {section} baseline for {'/'.join(keys)}; run pytest --record-baselines")
+        return value
+
+    def check_latency(self, corpus_name, interaction, measure):
+        """Record or check the wall time in seconds returned by measure()."""
+        elapsed = statistics.median(measure() for _ in range(MEASURE_ROUNDS))
+        if self.record:
+            self.data["latency_s"].setdefault(corpus_name, {})[interaction] = round(elapsed, 3)
+            return
+        baseline = self._baseline("latency_s", corpus_name, interaction)
+        budget = (baseline * LATENCY_MARGIN + LATENCY_SLACK) * BUDGET_SCALE
+        assert elapsed <= budget, f"{interaction} on {corpus_name} took {elapsed:.2f}s (budget {budget:.2f}s)"
+
+    def check_rss(self, corpus_name, measure):
+        """Record or check the peak RSS from measure(), and check retained RSS growth."""
+        samples = [measure() for _ in range(MEASURE_ROUNDS)]
+        peak = statistics.median(peak for _, _, peak in samples)
+        if self.record:
+            self.data["peak_rss_mb"][corpus_name] = round(peak / 2**20)
+            return
+        growth = statistics.median(last - first for first, last, _ in samples)
+        growth_budget = RSS_GROWTH_BUDGET_MB * BUDGET_SCALE * 2**20
+        assert growth <= growth_budget, f"retained RSS on {corpus_name} grew {growth / 2**20:.0f} MB over {RSS_RERUNS} reruns"
+        budget = self._baseline("peak_rss_mb", corpus_name) * RSS_MARGIN * BUDGET_SCALE * 2**20
+        assert peak <= budget, f"reruns on {corpus_name} peaked at {peak / 2**20:.0f} MB RSS (budget {budget / 2**20:.0f} MB)"
+
+    def save(self):
+        self.data["host"] = reference_host()
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+def make_text_pdf(path, page_count):
+    """Write a PDF whose pages are filled with plain paragraphs."""
+    doc = fitz.open()
+    for page_num in range(page_count):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (50, 50, -50, -50), f"Page {page_num + 1} " + LOREM * 12)
+    doc.save(path)
+    doc.close()
+
+
+def make_table_pdf(path, page_count, rows=12, cols=4):
+    """Write a PDF whose pages each hold one ruled table."""
+    doc = fitz.open()
+    for page_num in range(page_count):
+        page = doc.new_page()
+        x0, y0, cell_w, cell_h = 60, 80, 110, 24
+        for r in range(rows + 1):
+            page.draw_line((x0, y0 + r * cell_h), (x0 + cols * cell_w, y0 + r * cell_h))
+        for c in range(cols + 1):
+            page.draw_line((x0 + c * cell_w, y0), (x0 + c * cell_w, y0 + rows * cell_h))
+        for r in range(rows):
+            for c in range(cols):
+                label = f"H{c + 1}" if r == 0 else f"{page_num + 1}.{r}.{c}"
+                page.insert_text((x0 + c * cell_w + 4, y0 + r * cell_h + 16), label)
+    doc.save(path)
+    doc.close()
+
+
+def _scan_pixmap():
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 260))
+    pix.clear_with(180)
+    return pix
+
+
+def make_image_pdf(path, page_count):
+    """Write a PDF of scanned-style pages: one full-page image, no text layer."""
+    pix = _scan_pixmap()
+    doc = fitz.open()
+    for _ in range(page_count):
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pix)
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+
+
+def make_ocr_scan_pdf(path, page_count):
+    """Write a PDF of searchable scans: a full-page image under an invisible OCR text layer."""
+    pix = _scan_pixmap()
+    doc = fitz.open()
+    for page_num in range(page_count):
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pix)
+        page.insert_text((72, 72), f"Scanned page {page_num + 1} " + LOREM, render_mode=3)
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+
+
+CORPUS = {
+    "text_1": (make_text_pdf, 1),
+    "text_200": (make_text_pdf, 200),
+    "table_50": (make_table_pdf, 50),
+    "image_2000": (make_image_pdf, 2000),
+    "ocr_scan_5": (make_ocr_scan_pdf, 5),
+    "text_2000": (make_text_pdf, 2000),
+}
+
+
+def pin_secondary_tabs(set_attr=setattr):
+    """Keep the Camelot and PDFplumber tabs off the rerun path.
+
+    Every rerun renders all three tabs, so Camelot parsing each routed page (lattice
+    or stream depending on whether the machine has Ghostscript) and PDFplumber's
+    default "All Text" pass would otherwise dominate the PyMuPDF interaction being
+    measured. Camelot sees Ghostscript and finds no tables, PDFplumber sees a
+    document without pages. Pass monkeypatch.setattr to undo the patch after a test.
+    """
+    set_attr(directTextExtraction, "_is_ghostscript_available", lambda: True)
+    set_attr(directTextExtraction.camelot, "read_pdf", lambda **kwargs: [])
+    set_attr(
+        directTextExtraction.pdfplumber,
+        "open",
+        lambda *args, **kwargs: contextlib.nullcontext(types.SimpleNamespace(pages=[])),
+    )
+
+
+def without_ghostscript(set_attr=setattr):
+    """Make the Camelot tab take its stream path whether or not the host has Ghostscript."""
+    set_attr(directTextExtraction, "_is_ghostscript_available", lambda: False)
+
+
+def open_app(file_path):
+    """Return an AppTest of main.py with file_path already uploaded."""
+    at = AppTest.from_file(os.path.join(REPO_ROOT, "main.py"), default_timeout=1800)
+    at.session_state.file_path = file_path
+    at.session_state.file_uploaded = True
+    return at
+
+
+def loaded_app(file_path, mode):
+    """Return an app that has rendered the document once in the given PyMuPDF mode."""
+    at = open_app(file_path)
+    at.session_state["pymupdf_mode"] = mode
+    timed(at.run)
+    return at
+
+
+def timed(interaction):
+    """Run an interaction, fail on script exceptions, and return its wall time in seconds."""
+    start = time.perf_counter()
+    at = interaction()
+    elapsed = time.perf_counter() - start
+    assert not at.exception, [e.value for e in at.exception]
+    return elapsed
+
+
+def measure_rss(file_path, mode):
+    """Return (retained RSS after warm-up, retained RSS after RSS_RERUNS more, peak RSS) in bytes.
+
+    Runs in a fresh interpreter with the secondary tabs pinned, so native allocations
+    by MuPDF and pdfium are counted and earlier tests do not raise the high-water mark.
+    Retained RSS is the lowest post-collection RSS seen over each phase, so a late
+    garbage collection does not read as growth while a leak still raises the floor.
+    """
+    probe = subprocess.run(
+        [sys.executable, "-m", "tests.rss_probe", file_path, mode],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if probe.returncode:
+        pytest.fail(f"tests.rss_probe exited with {probe.returncode}:\n{probe.stderr[-2000:]}")
+    first, last, peak = probe.stdout.split()[-3:]
+    return int(first), int(last), int(peak)
+
@@ -0,0 +1,63 @@
+"""Print retained and peak RSS of reruns on one document; run by tests.helpers.measure_rss.
+
+Usage: python -m tests.rss_probe FILE_PATH MODE
+"""
+import ctypes
+import gc
+import os
+import sys
+
+from tests.helpers import RSS_RERUNS, RSS_WARMUP_RERUNS, loaded_app, pin_secondary_tabs, timed
+
+
+def _proc_status_bytes(field):
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError(f"/proc/self/status has no {field} field")
+
+
+def _max_rss_bytes():
+    # ru_maxrss survives fork/exec and would report the pytest parent's peak,
+    # so prefer the per-address-space high-water mark where Linux exposes it.
+    if os.path.exists("/proc/self/status"):
+        return _proc_status_bytes("VmHWM")
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _retained_rss_bytes():
+    # glibc keeps freed arenas mapped, so RSS after a collection swings by hundreds
+    # of MB between reruns unless they are trimmed first. Without /proc there is no
+    # current RSS; the growth check then degrades to comparing high-water marks.
+    gc.collect()
+    if sys.platform.startswith("linux"):
+        malloc_trim = getattr(ctypes.CDLL(None), "malloc_trim", None)
+        if malloc_trim is not None:
+            malloc_trim(0)
+    if os.path.exists("/proc/self/status"):
+        return _proc_status_bytes("VmRSS")
+    return _max_rss_bytes()
+
+
+def _rerun_retained_rss(at, reruns):
+    retained = []
+    for _ in range(reruns):
+        timed(at.run)
+        retained.append(_retained_rss_bytes())
+    return min(retained)
+
+
+def main(file_path, mode):
+    pin_secondary_tabs()
+    at = loaded_app(file_path, mode)
+    first = _rerun_retained_rss(at, RSS_WARMUP_RERUNS)
+    last = _rerun_retained_rss(at, RSS_RERUNS)
+    print(first, last, _max_rss_bytes())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], sys.argv[2])
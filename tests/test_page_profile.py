@@ -0,0 +1,154 @@
+import fitz
+import pytest
+
+from pages import directTextExtraction
+from pages.directTextExtraction import (
+    IMAGE_ONLY_COVERAGE,
+    camelot_pages,
+    image_only_pages,
+    profile_pages,
+    table_candidate_pages,
+)
+from tests.helpers import loaded_app, make_table_pdf, make_text_pdf, timed
+
+
+def profile_of(path):
+    with fitz.open(path) as doc:
+        return profile_pages(doc)
+
+
+def test_table_pages_are_candidates(corpus):
+    profile = profile_of(corpus("table_50"))
+    assert (profile["vector_count"] > 0).all()
+    for strategy in ("lines", "lattice", "stream"):
+        assert table_candidate_pages(profile, strategy).all()
+
+
+def test_text_pages_have_no_vectors(corpus):
+    profile = profile_of(corpus("text_200"))
+    assert (profile["vector_count"] == 0).all()
+    assert not image_only_pages(profile).any()
+    assert not table_candidate_pages(profile, "lines").any()
+    assert not table_candidate_pages(profile, "lattice").any()
+    assert table_candidate_pages(profile, "stream").all()
+
+
+def test_scanned_pages_are_image_only(corpus):
+    profile = profile_of(corpus("image_2000"))
+    assert image_only_pages(profile).all()
+    assert (profile["image_coverage"] >= IMAGE_ONLY_COVERAGE).all()
+    for strategy in ("lines", "lattice", "stream"):
+        assert not table_candidate_pages(profile, strategy).any()
+
+
+def test_ocr_scans_are_lattice_candidates(corpus):
+    profile = profile_of(corpus("ocr_scan_5"))
+    assert not image_only_pages(profile).any()
+    assert (profile["vector_count"] == 0).all()
+    assert not table_candidate_pages(profile, "lines").any()
+    assert table_candidate_pages(profile, "lattice").all()
+
+
+def test_image_count_exceeds_int16():
+    """Tiled maps and image-mask glyphs can draw one image tens of thousands of times."""
+    doc = fitz.open()
+    page = doc.new_page()
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4, 4))
+    page.insert_image(fitz.Rect(0, 0, 4, 4), pixmap=pix)
+    xref = page.get_contents()[-1]
+    doc.update_stream(xref, doc.xref_stream(xref) * 40000)
+    with doc:
+        assert profile_pages(doc)["image_count"].tolist() == [40000]
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path):
+    """Pages 1-2 are ruled tables, pages 3-4 plain text."""
+    tables, text, mixed = (str(tmp_path / name) for name in ("tables.pdf", "text.pdf", "mixed.pdf"))
+    make_table_pdf(tables, 2)
+    make_text_pdf(text, 2)
+    with fitz.open(tables) as doc, fitz.open(text) as other:
+        doc.insert_pdf(other)
+        doc.save(mixed)
+    return mixed
+
+
+def test_camelot_pages_by_flavor(mixed_pdf):
+    profile = profile_of(mixed_pdf)
+    assert camelot_pages(profile, [1, 2, 3, 4], "lattice") == [1, 2]
+    assert camelot_pages(profile, [1, 2, 3, 4], "stream") == [1, 2, 3, 4]
+    assert camelot_pages(profile, [4, 2], "lattice") == [2]
+
+
+@pytest.fixture
+def recorded_camelot_calls(request, monkeypatch):
+    """Report Ghostscript as installed and record (flavor, pages) of every camelot.read_pdf call.
+
+    Flavors named by a camelot_fails marker raise the error Camelot gives without Ghostscript.
+    """
+    marker = request.node.get_closest_marker("camelot_fails")
+    failing_flavors = marker.args if marker else ()
+    calls = []
+
+    def fake_read_pdf(filepath, flavor, pages, **kwargs):
+        calls.append((flavor, pages))
+        if flavor in failing_flavors:
+            raise RuntimeError("Ghostscript is not installed")
+        return []
+
+    monkeypatch.setattr(directTextExtraction, "_is_ghostscript_available", lambda: True)
+    monkeypatch.setattr(directTextExtraction.camelot, "read_pdf", fake_read_pdf)
+    return calls
+
+
+@pytest.mark.camelot_fails("lattice")
+def test_lattice_fallback_reroutes_pages_for_stream(mixed_pdf, recorded_camelot_calls):
+    at = loaded_app(mixed_pdf, "All Text")
+    timed(at.run)
+    assert recorded_camelot_calls[-2:] == [("lattice", "1,2"), ("stream", "1,2,3,4")]
+
+
+def test_table_detection_summarizes_pages_without_ruling_lines(mixed_pdf):
+    at = loaded_app(mixed_pdf, "Table Detection")
+    captions = [caption.value for caption in at.caption]
+    assert "2 page(s) skipped as having no ruling lines" in captions
+    assert not [w.value for w in at.warning if w.value.startswith("No tables found on page")]
+
+
+def test_table_detection_separates_pages_without_text(mixed_pdf, tmp_path):
+    path = str(tmp_path / "blank.pdf")
+    with fitz.open(mixed_pdf) as doc:
+        doc.new_page()
+        doc.save(path)
+    at = loaded_app(path, "Table Detection")
+    captions = [caption.value for caption in at.caption]
+    assert "1 page(s) skipped as having no text layer" in captions
+    assert "2 page(s) skipped as having no ruling lines" in captions
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        ("All Text", "2000 page(s) skipped as having no text layer"),
+        ("Table Detection", "2000 page(s) skipped as image-only"),
+    ],
+)
+def test_modes_skip_image_only_pages(corpus, mode, expected):
+    at = loaded_app(corpus("image_2000"), mode)
+    assert expected in [caption.value for caption in at.caption]
+    if mode == "All Text":
+        assert at.text_area[0].value == "No text found"
+
+
+def test_invalid_camelot_pages_are_reported(corpus):
+    at = loaded_app(corpus("text_1"), "All Text")
+    pages_input = next(t for t in at.text_input if t.label.startswith("Pages"))
+    timed(pages_input.input("99").run)
+    assert [e.value for e in at.error] == ["Invalid page number(s): 99. The document has 1 page(s)."]
+    assert "No tables found in the document" not in [w.value for w in at.warning]
+
+
+def test_camelot_skip_captions(mixed_pdf, recorded_camelot_calls):
+    at = loaded_app(mixed_pdf, "All Text")
+    assert recorded_camelot_calls == [("lattice", "1,2")]
+    assert "2 page(s) skipped as having no ruling lines" in [caption.value for caption in at.caption]
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from pages import directTextExtraction
+from tests.helpers import loaded_app, measure_rss, pin_secondary_tabs, timed, without_ghostscript
+
+CORPUS_NAMES = [
+    "text_1",
+    "text_200",
+    "table_50",
+    "image_2000",
+    pytest.param("text_2000", marks=pytest.mark.slow),
+]
+# Camelot's stream pass over all 2,000 pages of text_2000 needs more than 6 GB of
+# RSS in one rerun, so it has no full rerun budget. text_200 and table_50 take
+# seconds per full rerun and only run with --run-slow.
+FULL_RERUN_NAMES = [
+    "text_1",
+    pytest.param("text_200", marks=pytest.mark.slow),
+    pytest.param("table_50", marks=pytest.mark.slow),
+    "image_2000",
+]
+
+
+@pytest.fixture
+def pinned_secondary_tabs(monkeypatch):
+    pin_secondary_tabs(monkeypatch.setattr)
+
+
+@pytest.mark.usefixtures("pinned_secondary_tabs")
+@pytest.mark.parametrize("name", CORPUS_NAMES)
+def test_mode_switch_latency(corpus, baselines, name):
+    def mode_switch():
+        at = loaded_app(corpus(name), "All Text")
+        at.session_state["pymupdf_mode"] = "Search Text"
+        elapsed = timed(at.run)
+        assert at.text_input[0].label == "Enter text to search:"
+        return elapsed
+
+    baselines.check_latency(name, "mode_switch", mode_switch)
+
+
+@pytest.mark.usefixtures("pinned_secondary_tabs")
+@pytest.mark.parametrize("name", CORPUS_NAMES)
+def test_page_change_latency(corpus, baselines, name):
+    def page_change():
+        at = loaded_app(corpus(name), "Specific Page")
+        last_page = int(at.number_input[0].max)
+        elapsed = timed(at.number_input[0].set_value(last_page).run)
+        assert at.text_area[0].label == f"Page {last_page} Text:"
+        return elapsed
+
+    baselines.check_latency(name, "page_change", page_change)
+
+
+@pytest.mark.usefixtures("pinned_secondary_tabs")
+@pytest.mark.parametrize("name", CORPUS_NAMES)
+def test_search_keystroke_latency(corpus, baselines, name):
+    def search_keystroke():
+        at = loaded_app(corpus(name), "Search Text")
+        timed(at.text_input[0].input("i").run)
+        return timed(at.text_input[0].input("ip").run)
+
+    baselines.check_latency(name, "search_keystroke", search_keystroke)
+
+
+@pytest.mark.parametrize("name", FULL_RERUN_NAMES)
+def test_full_rerun_latency(corpus, baselines, monkeypatch, name):
+    """Time a search keystroke with every tab live, Camelot and PDFplumber included."""
+    without_ghostscript(monkeypatch.setattr)
+
+    def full_rerun():
+        at = loaded_app(corpus(name), "Search Text")
+        return timed(at.text_input[0].input("ip").run)
+
+    baselines.check_latency(name, "full_rerun", full_rerun)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="peak RSS is read from /proc or the resource module")
+@pytest.mark.parametrize("name", ["text_1", pytest.param("table_50", marks=pytest.mark.slow), "image_2000"])
+def test_rerun_rss(corpus, baselines, name):
+    baselines.check_rss(name, lambda: measure_rss(corpus(name), "Table Detection"))
+
+
+def test_pages_are_profiled_once_per_file(corpus, monkeypatch):
+    calls = []
+    profile_pages = directTextExtraction.profile_pages
+
+    def counted_profile_pages(doc):
+        calls.append(doc.name)
+        return profile_pages(doc)
+
+    monkeypatch.setattr(directTextExtraction, "profile_pages", counted_profile_pages)
+    at = loaded_app(corpus("image_2000"), "All Text")
+    at.session_state["pymupdf_mode"] = "Specific Page"
+    timed(at.run)
+    timed(at.number_input[0].set_value(2).run)
+    assert calls == [corpus("image_2000")]
+    at.session_state.file_path = corpus("text_1")
+    timed(at.run)
+    assert calls == [corpus("image_2000"), corpus("text_1")]